@@ -1,5 +1,5 @@
 from os.path import exists
-from os import makedirs
+from os import makedirs, environ, cpu_count
 
 TMP_DIR = "/tmp/bias_correction"
 
@@ -9,3 +9,8 @@ if not exists(TMP_DIR):
 TEST_DATA = "examples/etc/test_data.csv"
 
 TRAINING_OUTPUT_FILENAME = "training_output.pickle"
+
+# XGBoost training scales poorly past ~8 threads, so cap the thread count. The OpenMP
+# setting must be exported before xgboost (or sklearn) is imported to take effect
+N_THREADS = min(8, cpu_count() or 1)
+environ.setdefault("OMP_NUM_THREADS", str(N_THREADS))
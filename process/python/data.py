@@ -2,36 +2,81 @@
 from os.path import join, exists
 from os import makedirs
 from numpy import array as numpy_array
+from numpy import asarray as numpy_asarray
+from numpy import ascontiguousarray as numpy_ascontiguousarray
+from numpy import empty as numpy_empty
+from numpy import float32 as numpy_float32
 from numpy import min as numpy_min
 from numpy import max as numpy_max
-from sklearn.model_selection import train_test_split
-from pickle import dump as pickle_dump
-from pandas import read_csv
+from numpy import subtract as numpy_subtract
+from numpy import multiply as numpy_multiply
+from numpy import divide as numpy_divide
+from numpy import ones as numpy_ones
+from numpy import result_type as numpy_result_type
+from numpy import take as numpy_take
+from numpy import where as numpy_where
+from numpy import stack as numpy_stack
+from numpy.random import default_rng
+from numpy.typing import ArrayLike
+from math import ceil
+from numbers import Integral
+from functools import lru_cache
+from threading import local
+from importlib.util import find_spec
+from pickle import HIGHEST_PROTOCOL
+from joblib import dump as joblib_dump
+from joblib import load as joblib_load
 from process.python import TEST_DATA, TRAINING_OUTPUT_FILENAME
 
+# pyarrow is optional: when installed, pandas uses its multithreaded CSV parser
+# (checked with find_spec so pyarrow itself is not imported until a CSV is read)
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
 
-def combine_covariants_and_fcst(covariants: dict, fcst: list) -> numpy_array:
+
+class FeatureMatrix:
+    """
+    A feature matrix together with its column names.
+
+    Attributes:
+        values : numpy.ndarray
+            2D array with rows as observations and columns as features.
+        names : list
+            Name of each column in `values` (covariants followed by "fcst").
+    """
+    __slots__ = ("values", "names")
+
+    def __init__(self, values: numpy_array, names: list):
+        self.values = values
+        self.names = names
+
+
+def combine_covariants_and_fcst(covariants: dict, fcst: ArrayLike, dtype=numpy_float32) -> FeatureMatrix:
     """
-    Combine covariant vectors and a forecast vector into a transposed NumPy array.
+    Combine covariant vectors and a forecast vector into a NumPy array.
     
     This function takes a dictionary of covariant vectors and a forecast vector, checks
-    that all vectors have the same length, and combines them into a NumPy array where
-    rows represent observations and columns represent features (covariants plus forecast).
+    that all vectors have the same length, and writes them into a preallocated
+    C-contiguous NumPy array where rows represent observations and columns represent
+    features (covariants plus forecast).
     
     Parameters:
     -----------
     covariants : dict
         A dictionary where keys are covariant names (str) and values are lists or arrays
         of numeric values representing the covariants.
-    fcst : list
-        A list of numeric values representing the forecast.
+    fcst : array-like
+        Numeric values representing the forecast. NumPy arrays are the fast path; lists
+        are accepted but every element has to be converted from a Python object.
+    dtype : numpy dtype, optional
+        Data type of the output array. Defaults to float32, which halves the memory
+        footprint compared with float64 and is what XGBoost works in internally.
     
     Returns:
     --------
-    numpy.ndarray
-        A 2D NumPy array with shape (n, k+1), where n is the length of the vectors and
-        k is the number of covariants. The array is transposed so that rows are observations
-        and columns are features (covariants followed by forecast).
+    FeatureMatrix
+        `values` is a 2D NumPy array with shape (n, k+1), where n is the length of the
+        vectors and k is the number of covariants. Rows are observations and columns are
+        features (covariants followed by forecast). `names` lists the column names.
     
     Raises:
     -------
@@ -42,30 +87,134 @@ def combine_covariants_and_fcst(covariants: dict, fcst: list) -> numpy_array:
     ---------
     >>> covariants = {'x1': [1, 2, 3], 'x2': [4, 5, 6]}
     >>> fcst = [7, 8, 9]
-    >>> combine_covariants_and_fcst(covariants, fcst)
-    array([[1, 4, 7],
-           [2, 5, 8],
-           [3, 6, 9]])
+    >>> combine_covariants_and_fcst(covariants, fcst).values
+    array([[1., 4., 7.],
+           [2., 5., 8.],
+           [3., 6., 9.]], dtype=float32)
     
     >>> covariants = {'x1': [1, 2]}
     >>> fcst = [7, 8, 9]
     >>> combine_covariants_and_fcst(covariants, fcst)
     Exception: Covariant x1 does not have the same length as fcst
     """
-    fcst_length = len(fcst)
-    x_values = []
     cov_names = list(covariants.keys())
 
-    for cov_name in cov_names:
+    # num * features
+    x_values = numpy_empty((len(fcst), len(cov_names) + 1), dtype=dtype)
+    combine_into(x_values, covariants, fcst)
+
+    return FeatureMatrix(x_values, cov_names + ["fcst"])
+
+
+def combine_into(out: numpy_array, covariants: dict, fcst: ArrayLike):
+    """
+    Write covariant vectors and a forecast vector into an existing array.
+
+    This is the in-place version of `combine_covariants_and_fcst`, for callers that
+    reuse one buffer across repeated calls (e.g., prediction requests) instead of
+    allocating a new array each time.
+
+    Parameters:
+    -----------
+    out : numpy.ndarray
+        A 2D array with shape (n, k+1), filled column by column with the covariants
+        (in the order of `covariants`) followed by the forecast.
+    covariants : dict
+        A dictionary where keys are covariant names (str) and values are lists or arrays
+        of numeric values representing the covariants.
+    fcst : array-like
+        Numeric values representing the forecast. NumPy arrays are the fast path; lists
+        are accepted but every element has to be converted from a Python object.
+
+    Raises:
+    -------
+    Exception
+        If any covariant vector’s length does not match the length of `fcst`.
+    """
+    try:
+        # One C-level stack straight into `out`; ragged input makes it raise
+        numpy_stack(list(covariants.values()) + [fcst], axis=1, out=out)
+    except ValueError:
+        # Only on failure: find the offending covariant for a clearer message
+        for cov_name, cov_value in covariants.items():
+            if not len(cov_value) == len(fcst):
+                raise Exception(f"Covariant {cov_name} does not have the same length as fcst")
+        raise
+
+
+class ScalerFn:
+    """
+    A saved min-max scaler bound to a fixed list of feature names.
+
+    Instances are created by `bind_scaler`, which checks the feature names once, so
+    calling the instance on new data (e.g., repeatedly in a prediction loop) only
+    does the scaling arithmetic.
+
+    Attributes:
+        min : numpy.ndarray
+            Minimum value per column from the training data.
+        inv_range : numpy.ndarray
+            Reciprocal of (max - min) per column, 1 where the range is zero.
+        names : list
+            Names of the columns the scaler was trained on.
+    """
+    __slots__ = ("min", "inv_range", "names")
+
+    def __init__(self, min_vals: numpy_array, inv_range: numpy_array, names: list):
+        self.min = min_vals
+        self.inv_range = inv_range
+        self.names = names
+
+    def __call__(self, x_values) -> numpy_array:
+        x_values = numpy_asarray(x_values)
+
+        # Apply min-max scaling: (x - min) * (1 / (max - min)), in place on one buffer
+        scaled_value = numpy_subtract(
+            x_values, self.min, dtype=numpy_result_type(x_values, self.inv_range))
+        numpy_multiply(scaled_value, self.inv_range, out=scaled_value)
+
+        return scaled_value
+
+
+def _inv_range(range_vals: numpy_array) -> numpy_array:
+    """Reciprocal of the range per column, left at 1 where the range is 0 (to avoid division by zero)."""
+    inv_range = numpy_ones(range_vals.shape, dtype=numpy_result_type(range_vals, 1.0))
+    numpy_divide(1.0, range_vals, where=range_vals != 0, out=inv_range)
+    return inv_range
+
+
+def bind_scaler(scaler: dict, names: list) -> ScalerFn:
+    """
+    Validate a saved scaler against the feature names once and return a callable scaler.
+
+    Parameters:
+        scaler : dict
+            A dictionary containing 'min', 'inv_range' and 'names' from a previous scaling
+            operation (e.g., from init_scaler).
+        names : list
+            Feature names the scaler will be applied to. They must be the same (and
+            in the same order) as the names the scaler was trained on.
+
+    Returns: ScalerFn
+        A callable applying the scaler to new data without re-checking the names.
+
+    Examples:
+        >>> x_train = np.array([[1, 4], [2, 5], [3, 6]])
+        >>> result = init_scaler(x_train, ["x1", "fcst"])
+        >>> scaler_fn = bind_scaler(result['scaler'], ["x1", "fcst"])
+        >>> print(scaler_fn(np.array([[2, 5], [3, 6]])))
+        [[0.5 0.5]
+        [1.  1. ]]
+    """
+    if not scaler["names"] == names:
+        raise Exception("Scaler does not have consistent names")
 
-        cov_value = covariants[cov_name]
-        if not len(cov_value) == fcst_length:
-            raise Exception(f"Covariant {cov_name} does not have the same length as fcst")
-        x_values.append(covariants[cov_name])
-    x_values.append(fcst)
+    # Scalers exported before the reciprocal range was cached only have 'min' and 'max'
+    inv_range = scaler.get("inv_range")
+    if inv_range is None:
+        inv_range = _inv_range(scaler["max"] - scaler["min"])
 
-    # return num * features
-    return {"names": cov_names + ["fcst"], "value": numpy_array(x_values).T}
+    return ScalerFn(scaler["min"], inv_range, scaler["names"])
 
 
 def apply_saved_scaler(x_values, scaler, names: None or list = None):
@@ -77,15 +226,18 @@ def apply_saved_scaler(x_values, scaler, names: None or list = None):
             Input data as a matrix with rows as observations and columns as features.
             Must have the same number of columns as the scaler was trained on.
         scaler : dict
-            A dictionary containing 'min' and 'max' arrays from a previous scaling operation
-            (e.g., from init_scaler), representing the minimum and maximum values per column.
+            A dictionary containing 'min', 'max' and 'inv_range' arrays from a previous scaling
+            operation (e.g., from init_scaler), representing the minimum and maximum values per
+            column and the reciprocal of their range.
     
     Returns: numpy.ndarray
         A scaled matrix with the same dimensions as x_values, transformed to [0, 1]
         using the formula (x - min) / (max - min).
     
-    Notes: Ensures input is a NumPy array, applies the saved min and max values to scale the data.
-    If a column's range (max - min) is zero, it is set to 1 to avoid division by zero.
+    Notes: Ensures input is a NumPy array, applies the saved min and the cached reciprocal range
+    to scale the data, so only one output array is allocated and no division is needed.
+    For repeated calls with the same features, use `bind_scaler` once instead, which
+    skips the name check on every call.
     
     Examples:
         >>> x_train = np.array([[1, 4], [2, 5], [3, 6]])
@@ -96,20 +248,9 @@ def apply_saved_scaler(x_values, scaler, names: None or list = None):
         [[0.5 0.5]
         [1.  1. ]]
     """
-    if names is not None:
-        if not scaler["names"] == names:
-            raise Exception("Scaler does not have consistent names")
-    
-    # Calculate range (max - min) from scaler
-    range_vals = scaler['max'] - scaler['min']
-    
-    # Handle case where range is 0 (to avoid division by zero)
-    range_vals[range_vals == 0] = 1
-    
-    # Apply min-max scaling: (x - min) / (max - min)
-    scaled_value = (x_values - scaler['min']) / range_vals
-    
-    return scaled_value
+    if names is None:
+        names = scaler["names"]
+    return bind_scaler(scaler, names)(x_values)
 
 
 def init_scaler(x_values: numpy_array, covariants_names: list):
@@ -123,13 +264,14 @@ def init_scaler(x_values: numpy_array, covariants_names: list):
     
     Returns:
         dict: A dictionary containing:
-            - 'scaler': dict with 'min' and 'max' arrays for each column.
+            - 'scaler': dict with 'min', 'max' and 'inv_range' (1 / (max - min)) arrays
+              for each column, the column 'names' and a 'name_to_idx' lookup.
             - 'value': scaled NumPy array with values in [0, 1].
     
     Notes:
         Ensures input is a NumPy array, computes min and max per column, and applies
-        min-max scaling: (x - min) / (max - min). If a column's range is zero, it is
-        set to 1 to avoid division by zero.
+        min-max scaling: (x - min) / (max - min) in place on one output array. If a
+        column's range is zero, its reciprocal range is set to 1 to avoid division by zero.
     
     Examples:
         >>> x = np.array([[1, 4], [2, 5], [3, 6]])
@@ -139,6 +281,8 @@ def init_scaler(x_values: numpy_array, covariants_names: list):
         [0.5 0.5]
         [1.  1. ]]
     """
+    x_values = numpy_asarray(x_values)
+
     # Get min and max for each column (axis=0 means column-wise)
     min_vals = numpy_min(x_values, axis=0)
     max_vals = numpy_max(x_values, axis=0)
@@ -146,15 +290,25 @@ def init_scaler(x_values: numpy_array, covariants_names: list):
     # Calculate range (max - min) for each column
     range_vals = max_vals - min_vals
     
-    # Handle case where range is 0 (to avoid division by zero)
-    range_vals[range_vals == 0] = 1
+    # Cache the reciprocal so applying the scaler is a multiply rather than a divide,
+    # leaving it at 1 where the range is 0 (to avoid division by zero)
+    inv_range = _inv_range(range_vals)
     
-    # Apply min-max scaling: (x - min) / (max - min)
-    scaled_value = (x_values - min_vals) / range_vals
+    # Apply min-max scaling: (x - min) / (max - min), writing both steps into
+    # a single output buffer so the data is only streamed once more
+    scaled_value = numpy_subtract(
+        x_values, min_vals, dtype=numpy_result_type(x_values, inv_range))
+    numpy_multiply(scaled_value, inv_range, out=scaled_value)
     
     # Return a dictionary with scaler and scaled values
     return {
-        'scaler': {"min": min_vals, "max": max_vals, "names": covariants_names},
+        'scaler': {
+            "min": min_vals,
+            "max": max_vals,
+            "inv_range": inv_range,
+            "names": covariants_names,
+            "name_to_idx": {name: i for i, name in enumerate(covariants_names)},
+        },
         'value': scaled_value
     }
 
@@ -171,6 +325,9 @@ def reverse_scaler(
             Scaled data as a NumPy array with values in [0, 1], matching the shape of the original data.
         scaler : dict
             Dictionary containing 'min' and 'max' arrays from the original scaling (output of init_scaler).
+        selected_name : str or None
+            If given, only this column is unscaled and returned (looked up via 'name_to_idx',
+            or 'names' for scalers saved without it).
 
     Returns:
         np.ndarray
@@ -193,36 +350,90 @@ def reverse_scaler(
     min_vals = scaler["min"]
     max_vals = scaler["max"]
 
-    # Calculate range (max - min)
+    # Only reverse the selected column, instead of the whole array
+    if selected_name is not None:
+        # Scalers exported before the lookup was cached only have the 'names' list
+        name_to_idx = scaler.get("name_to_idx")
+        idx = scaler["names"].index(selected_name) if name_to_idx is None else name_to_idx[selected_name]
+        scaled_values = scaled_values[:, idx]
+        min_vals = min_vals[idx]
+        max_vals = max_vals[idx]
+
+    # Calculate range (max - min), set to 1 where it is 0, as when the data was scaled
+    # (training rows of such a column are 0, but test and predict rows are x - min)
     range_vals = max_vals - min_vals
-
-    # Handle zero-range case (though not strictly necessary for reversal, included for consistency)
-    range_vals[range_vals == 0] = 1
+    range_vals = numpy_where(range_vals == 0, 1, range_vals)
 
     # Reverse the scaling: scaled * (max - min) + min
-    unscaled_values = scaled_values * range_vals + min_vals
-
-    if selected_name is None:
-        return unscaled_values
-    
-    return unscaled_values[:, scaler["names"].index(selected_name)]
+    return scaled_values * range_vals + min_vals
 
 
 def prep_data_for_training(
-    fcst: list, covariants: dict, obs: list, test_size: float = 0.2, random_state: int or None = None
+    fcst: ArrayLike,
+    covariants: dict,
+    obs: ArrayLike,
+    test_size: float or int = 0.2,
+    random_state: int or None = None,
+    dtype=numpy_float32,
 ) -> dict:
-    x_info = combine_covariants_and_fcst(covariants, fcst)
-    y = numpy_array(obs)  # Target (obs) as a 1D array
+    """
+    Prepares data for training by combining forecasts and covariants, splitting them into
+    train and test sets, and scaling both with a scaler fitted on the train set.
 
-    x_train, x_test, y_train, y_test = train_test_split(
-        x_info["value"], y, test_size=test_size, random_state=random_state
-    )
+    Args:
+        fcst (array-like): The forecast values.
+        covariants (dict): A dictionary containing covariant data, as expected by
+            `combine_covariants_and_fcst`.
+        obs (array-like): The observed (target) values. An ndarray of `dtype` is used
+            without copying; lists are accepted but slower to convert.
+        test_size (float or int, optional): Proportion of the data used for the test set (between
+            0 and 1), or, as an int, the number of test samples. Defaults to 0.2.
+        random_state (int or None, optional): Seed for the train-test split. Defaults to None.
+        dtype (numpy dtype, optional): Data type of the returned arrays. Defaults to float32.
 
-    scaled_x_train_results = init_scaler(x_train, x_info["names"])
+    Returns:
+        dict: "x_train", "x_test", "y_train", "y_test", "scaler" and "x_names". The feature
+            matrices are C-contiguous arrays of `dtype`, so sklearn and XGBoost can use them
+            without making their own converted copy.
+
+    Raises:
+        Exception: If test_size is not a proportion or a sample count, or if it would
+            leave the train or the test set empty.
+    """
+    x_info = combine_covariants_and_fcst(covariants, fcst, dtype=dtype)
+    y = numpy_asarray(obs, dtype=dtype)  # Target (obs) as a 1D array, not copied if already one
+
+    # The test set has ceil(n * test_size) rows, or test_size rows for an int,
+    # as with sklearn's train_test_split
+    n = len(y)
+    if isinstance(test_size, Integral):
+        n_test = int(test_size)
+    elif 0 < test_size < 1:
+        n_test = ceil(n * test_size)
+    else:
+        raise Exception(f"test_size must be between 0 and 1, or a number of samples, got {test_size}")
+
+    if not 0 < n_test < n:
+        raise Exception(f"test_size={test_size} leaves the train or the test set empty ({n} samples)")
+
+    # Gather all rows in shuffled order once; the test and train sets are then
+    # contiguous views of that one array
+    idx = default_rng(random_state).permutation(n)
+
+    x_shuffled = numpy_take(x_info.values, idx, axis=0)
+    y_shuffled = numpy_take(y, idx)
+    x_test, x_train = x_shuffled[:n_test], x_shuffled[n_test:]
+    y_test, y_train = y_shuffled[:n_test], y_shuffled[n_test:]
+
+    scaled_x_train_results = init_scaler(x_train, x_info.names)
     x_train = scaled_x_train_results["value"]
 
     scaler = scaled_x_train_results["scaler"]
-    x_test = apply_saved_scaler(x_test, scaler, names = x_info["names"])
+    x_test = apply_saved_scaler(x_test, scaler, names = x_info.names)
+
+    # Already C-contiguous `dtype` on this path, in which case these return the inputs as-is
+    x_train = numpy_ascontiguousarray(x_train, dtype=dtype)
+    x_test = numpy_ascontiguousarray(x_test, dtype=dtype)
 
     return {
         "x_train": x_train, 
@@ -230,69 +441,147 @@ def prep_data_for_training(
         "y_train": y_train, 
         "y_test": y_test, 
         "scaler": scaler, 
-        "x_names": x_info["names"]}
+        "x_names": x_info.names}
+
 
+_PREDICT_BUFFERS = local()
 
-def prep_data_for_predicting(fcst: list, covariants: dict, scaler: dict) -> numpy_array:
+
+def _predict_buffer(shape: tuple, dtype=numpy_float32) -> numpy_array:
+    """Return this thread's prediction buffer, reallocating it only when the shape changes."""
+    buffer = getattr(_PREDICT_BUFFERS, "values", None)
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        buffer = numpy_empty(shape, dtype=dtype)
+        _PREDICT_BUFFERS.values = buffer
+    return buffer
+
+
+def prep_data_for_predicting(fcst: ArrayLike, covariants: dict, scaler: dict or ScalerFn) -> numpy_array:
     """
     Prepares data for prediction by combining forecasts and covariants, and applying a saved scaler.
 
     Args:
-        fcst (list): A list representing the forecast values.
+        fcst (array-like): The forecast values (NumPy arrays are the fast path).
         covariants (dict): A dictionary containing covariant data. The structure is assumed to be
-            compatible with the `combine_covariants_and_fcst` function.
-        scaler (dict): A dictionary containing the saved scaler parameters, as expected by
-            the `apply_saved_scaler` function.
+            compatible with the `combine_covariants_and_fcst` function, and its keys must be the
+            covariant names the scaler was trained on (in any order).
+        scaler (dict or ScalerFn): A dictionary containing the saved scaler parameters, as expected by
+            the `apply_saved_scaler` function, or a scaler already bound by `bind_scaler`.
+
+    Raises:
+        Exception: If the covariant names do not match the names the scaler was trained on.
 
     Returns:
         numpy.ndarray: A numpy array containing the scaled, combined forecast and covariant data.
 
     Example:
-        Assuming `combine_covariants_and_fcst` returns a dictionary like:
-        {'value': numpy_array, 'names': list_of_names}
+        Assuming `combine_into` writes the covariants and forecasts into a numpy_array
         and `apply_saved_scaler` applies the scaling and returns a numpy array,
         this function will combine the forecasts and covariants, scale the resulting values,
         and return the scaled numpy array.
     """
-    x_info = combine_covariants_and_fcst(covariants, fcst)
-    return apply_saved_scaler(x_info["value"], scaler, names = x_info["names"])
+    names = scaler.names if isinstance(scaler, ScalerFn) else scaler["names"]
+    cov_names = names[:-1]
+    if not (len(covariants) == len(cov_names) and all(name in covariants for name in cov_names)):
+        raise Exception("Scaler does not have consistent names")
+
+    # The combined values are only an intermediate (scaling writes a new array),
+    # so they go into a per-thread buffer that is reused across calls. The columns
+    # are filled in the scaler's order, whatever the order of `covariants`
+    x_values = _predict_buffer((len(fcst), len(names)))
+    combine_into(x_values, {name: covariants[name] for name in cov_names}, fcst)
+
+    if isinstance(scaler, ScalerFn):
+        return scaler(x_values)
+    return apply_saved_scaler(x_values, scaler, names = names)
+
+
+@lru_cache(maxsize=1)
+def _load_test_data() -> numpy_array:
+    """Read the test CSV once; later calls return the cached array.
+
+    Only the columns used by makeup_data are parsed, directly as float32 (no type inference),
+    and they are converted to NumPy in one batch: a read-only (5, n) array whose rows are
+    y, x1, x2, x3 and x4, so each row is a contiguous column of the CSV.
+    """
+    from pandas import read_csv
+
+    test_data = read_csv(
+        TEST_DATA,
+        engine=CSV_ENGINE,
+        usecols=["x1", "x2", "x3", "x4", "y"],
+        dtype=numpy_float32,
+    )
+
+    values = numpy_ascontiguousarray(
+        test_data[["y", "x1", "x2", "x3", "x4"]].to_numpy(dtype=numpy_float32).T)
+    values.setflags(write=False)
+
+    return values
 
 
 def makeup_data():
     """Make up some test datasets
 
+    The CSV is only parsed on the first call. The returned arrays share memory with
+    the cached data, so they are read-only.
+
     Returns:
-        _type_: _description_
+        dict: "obs", "fcst" and "covariants", each holding float32 NumPy arrays
+            (kept as arrays rather than lists so no per-element Python objects are created)
     """
-    test_data = read_csv(TEST_DATA)
+    obs, fcst, var1, var2, var3 = _load_test_data()
 
     data = {
-        "obs": list(test_data["y"]),
-        "fcst": list(test_data["x1"]),
+        "obs": obs,
+        "fcst": fcst,
         "covariants": {
-            "var1": list(test_data["x2"]),
-            "var2": list(test_data["x3"]),
-            "var3": list(test_data["x4"])
+            "var1": var1,
+            "var2": var2,
+            "var3": var3
         },
     }
 
     return data
 
 
-def export(output: dict, output_dir: str = ""):
+def export(output: dict, output_dir: str = "", compress: int or tuple = 0):
     """
-    Exports a dictionary to a pickle file.
+    Exports a dictionary to a joblib file.
+
+    joblib writes the NumPy arrays in the output (e.g., the scaler) as raw buffers
+    instead of pickling them element by element, which is faster and smaller. joblib
+    opens and closes the file itself, so no file handle is left open. The rest of the
+    output (e.g., the model) is pickled with the highest protocol available, which
+    frames large bytes objects (such as a serialized XGBoost booster) without extra copies.
 
     Args:
         output (dict): The dictionary to be exported.
-        output_dir (str, optional): The directory where the pickle file will be saved.
+        output_dir (str, optional): The directory where the file will be saved.
                                      Defaults to the current working directory.
+        compress (int or tuple, optional): Compression passed to joblib.dump, e.g. 3 (zlib)
+                                     or ("lz4", 3) when lz4 is installed, which is much
+                                     faster than zlib at a similar ratio. Defaults to 0
+                                     (no compression, fastest to write).
     """
 
     if not exists(output_dir) and len(output_dir) > 0:
         makedirs(output_dir)
 
-    pickle_dump(
-        output,
-        open(join(output_dir, TRAINING_OUTPUT_FILENAME), "wb"),
-    )
+    joblib_dump(
+        output, join(output_dir, TRAINING_OUTPUT_FILENAME),
+        compress=compress, protocol=HIGHEST_PROTOCOL)
+
+
+def load_output(output_dir: str = "") -> dict:
+    """
+    Loads a dictionary saved by `export`.
+
+    Args:
+        output_dir (str, optional): The directory where the file was saved.
+                                     Defaults to the current working directory.
+
+    Returns:
+        dict: The exported dictionary (e.g., with "model" and "scaler").
+    """
+    return joblib_load(join(output_dir, TRAINING_OUTPUT_FILENAME))
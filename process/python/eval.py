@@ -1,10 +1,25 @@
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
-from sklearn.ensemble import RandomForestRegressor
+from typing import TYPE_CHECKING
 from numpy import sqrt, array
-from pandas import DataFrame
-from process.python.vis import plot_data
+from numpy import abs as numpy_abs
+from numpy import dot as numpy_dot
+from numpy import argsort as numpy_argsort
+from numpy import asarray as numpy_asarray
+from numpy import subtract as numpy_subtract
+from numpy import float64 as numpy_float64
+from numpy import float32 as numpy_float32
+from numpy import asfortranarray as numpy_asfortranarray
+from process.python.vis import plot_data, save_figure
 from process.python.data import reverse_scaler
 
+# pandas and sklearn are imported inside the functions that use them, so importing
+# this module stays cheap
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# Above this many samples, each tree in run_feature_importance is fitted on a half-size bootstrap
+SUBSAMPLE_THRESHOLD = 100000
+
+
 def run_plot(fcst: list, obs: list, data: dict, results: dict):
     """Generates plots comparing forecast vs observation and data before/after bias correction.
 
@@ -15,11 +30,11 @@ def run_plot(fcst: list, obs: list, data: dict, results: dict):
         results (dict): Dictionary with prediction results, including 'y_pred' (list or array).
 
     Behavior:
-        Iterates over use_scatter = True and False to produce two sets of plots:
-        - Forecast vs observation plot ('fcst_vs_obs[_scatter].png').
-        - Data comparison plot with before and after bias correction ('fcst_vs_obs[_scatter].png').
-        Both sets are saved as scatter and line plots in the 'test' directory using plot_data().
-        Note: The second plot_data call overwrites the filename from the first; this may be unintended.
+        Iterates over use_scatter = True and False to produce one figure each ('bc[_scatter].png')
+        with two panels:
+        - Forecast vs observation.
+        - Data comparison before and after bias correction.
+        Both figures are saved in the 'test' directory.
 
     Returns:
         None: Saves plots to files as a side effect.
@@ -31,26 +46,44 @@ def run_plot(fcst: list, obs: list, data: dict, results: dict):
         >>> results = {'y_pred': [1.1, 2.2, 3.3]}
         >>> run_plot(fcst, obs, data, results)
     """
+    # The comparison data is the same for both plot styles, so compute it once
+    bc_data = {
+        "after_bc": results["y_pred"],
+        "before_bc_scaled": data["x_test"][:, data["x_names"].index("fcst")],
+        "before_bc_raw": reverse_scaler(data["x_test"], data["scaler"], selected_name="fcst"),
+        "obs": data["y_test"]
+    }
+
+    # matplotlib is only imported when a plot is actually made
+    from matplotlib.pyplot import subplots
+
+    # Draw both comparisons as panels of one figure, so each style is rendered and saved once
     for use_scatter in [True, False]:
-        filename = f"fcst_vs_obs{'_scatter' if use_scatter else ''}.png"
-        plot_data({"fcst": fcst, "obs": obs}, use_scatter=use_scatter, filename=filename, output_dir="test")
+        fig, (ax_fcst, ax_bc) = subplots(1, 2, figsize=(12.8, 4.8))
         plot_data(
-            {
-                "after_bc": results["y_pred"],
-                "before_bc_scaled": data["x_test"][:,data["x_names"].index("fcst")],
-                "before_bc_raw": reverse_scaler(data["x_test"], data["scaler"], selected_name="fcst"),
-                "obs": data["y_test"]
-            }, 
+            {"fcst": fcst, "obs": obs},
+            use_scatter=use_scatter,
+            title_str="Forecast vs observation",
+            ax=ax_fcst
+        )
+        plot_data(
+            bc_data, 
             use_scatter=use_scatter, 
             x_name = "obs", 
             y_names = ["after_bc", "before_bc_scaled", "before_bc_raw"],
             title_str = "Data comparison",
-            filename = f"bc{'_scatter' if use_scatter else ''}.png",
-            output_dir="test"
+            ax=ax_bc
         )
+        save_figure(fig, "test", f"bc{'_scatter' if use_scatter else ''}.png")
 
 
-def run_feature_importance(x: array, y: array, x_names: list, n_estimators: int = 100) -> DataFrame:
+def run_feature_importance(
+    x: array,
+    y: array,
+    x_names: list,
+    n_estimators: int = 100,
+    random_state: int or None = None,
+) -> "DataFrame":
     """Calculate feature importance using Random Forest regression.
 
     This function trains a Random Forest Regressor on the input features and target,
@@ -65,7 +98,11 @@ def run_feature_importance(x: array, y: array, x_names: list, n_estimators: int
     x_names : list of str
         Names of the features corresponding to columns in x.
     n_estimators : int, default=100
-        The number of trees in the Random Forest.
+        The number of trees in the Random Forest. The trees are fitted in parallel on
+        all cores, and on a half-size bootstrap sample each when x has more than
+        SUBSAMPLE_THRESHOLD rows.
+    random_state : int or None, default=None
+        Seed for the Random Forest.
 
     Returns
     -------
@@ -85,20 +122,33 @@ def run_feature_importance(x: array, y: array, x_names: list, n_estimators: int
     >>> feat_imp = run_feature_importance(X, y, names)
     >>> print(feat_imp)
     """
-    model = RandomForestRegressor(n_estimators=n_estimators)
+    from pandas import DataFrame
+    from sklearn.ensemble import RandomForestRegressor
+
+    # The tree splitter scans one feature at a time, so give it column-major (Fortran order)
+    # float32 data, which is also the dtype sklearn's trees work in
+    x = numpy_asfortranarray(x, dtype=numpy_float32)
+
+    model = RandomForestRegressor(
+        n_estimators=n_estimators,
+        n_jobs=-1,  # Trees are independent, so fit them on all cores
+        max_samples=0.5 if len(x) > SUBSAMPLE_THRESHOLD else None,
+        random_state=random_state,
+    )
     model.fit(x, y)
 
-    # Get feature importance
+    # Get feature importance, sorted with NumPy so the DataFrame is only built once
+    importance = model.feature_importances_
+    order = numpy_argsort(-importance, kind="stable")
     feature_importance = DataFrame({
-        'feature': x_names,
-        'importance': model.feature_importances_
+        'feature': [x_names[i] for i in order],
+        'importance': importance[order]
     })
-    feature_importance = feature_importance.sort_values('importance', ascending=False)
 
     return feature_importance
 
 
-def run_eval(y_pred: array, y_test: array) -> DataFrame:
+def run_eval(y_pred: array, y_test: array) -> "DataFrame":
     """
     Calculate regression evaluation metrics for predicted vs actual values.
 
@@ -112,29 +162,52 @@ def run_eval(y_pred: array, y_test: array) -> DataFrame:
 
     Returns
     -------
-    dict
-        Dictionary containing three evaluation metrics:
-            - 'RMSE': Root Mean Squared Error (float)
-            - 'Rsquared': R-squared coefficient of determination (float)
-            - 'MAE': Mean Absolute Error (float)
+    DataFrame
+        Table with a 'metrics' (name) and a 'value' (float64) column, holding:
+            - 'RMSE': Root Mean Squared Error
+            - 'RSquared': R-squared coefficient of determination
+            - 'MAE': Mean Absolute Error
 
     Examples
     --------
     >>> y_pred = [2.5, 0.0, 2, 8]
     >>> y_test = [3, -0.5, 2, 7]
     >>> run_eval(y_pred, y_test)
-    {'RMSE': 0.612..., 'Rsquared': 0.948..., 'MAE': 0.5}
+        metrics     value
+    0      RMSE  0.612372
+    1  RSquared  0.948608
+    2       MAE  0.500000
 
     Notes
     -----
     - RMSE: Lower values indicate better fit (0 is perfect)
     - R-squared: Values closer to 1 indicate better fit
     - MAE: Lower values indicate better fit (0 is perfect)
+    - The metrics are computed directly with NumPy in one reusable work buffer,
+      rather than through three separate sklearn metric calls
     """
-    RMSE = sqrt(mean_squared_error(y_test, y_pred))
-    Rsquared = r2_score(y_test, y_pred)
-    MAE = mean_absolute_error(y_test, y_pred)
-
-    metrics = DataFrame.from_dict({"metrics": ["RMSE", "RSquared", "MAE"], "value": [RMSE, Rsquared, MAE]})
+    y_test = numpy_asarray(y_test)
+    y_pred = numpy_asarray(y_pred)
+    n = len(y_test)
+
+    # A single float64 work buffer serves all three reductions, with no other temporaries:
+    # it holds the residuals, then their absolute values, then the centered y_test
+    buffer = numpy_subtract(y_test, y_pred, dtype=numpy_float64)
+    sse = numpy_dot(buffer, buffer)
+    sae = numpy_abs(buffer, out=buffer).sum()
+    numpy_subtract(y_test, y_test.mean(dtype=numpy_float64), out=buffer)
+    sst = numpy_dot(buffer, buffer)
+
+    RMSE = sqrt(sse / n)
+    # Same convention as sklearn's r2_score for a constant y_test
+    Rsquared = 1.0 - sse / sst if sst != 0 else float(sse == 0)
+    MAE = sae / n
+
+    from pandas import DataFrame
+
+    # Build the columns with their final dtypes, so pandas has nothing to infer
+    metrics = DataFrame({
+        "metrics": array(["RMSE", "RSquared", "MAE"], dtype=object),
+        "value": array([RMSE, Rsquared, MAE], dtype=numpy_float64)})
 
     return metrics
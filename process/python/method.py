@@ -1,7 +1,27 @@
-from xgboost import XGBRegressor
 from numpy import array
-from pandas import DataFrame
-from sklearn.linear_model import LinearRegression
+from numpy import asarray as numpy_asarray
+from numpy import empty as numpy_empty
+from numpy import float64 as numpy_float64
+from numpy.linalg import lstsq
+from process.python import N_THREADS
+
+# xgboost is imported inside the function that uses it, so that
+# importing this module (e.g., only for predicting or exporting) stays cheap
+
+
+def detect_device() -> str:
+    """
+    Detect the device XGBoost should train on.
+
+    Returns:
+        str: "cuda" if a CUDA device is visible (checked via cupy, when installed),
+            otherwise "cpu".
+    """
+    try:
+        from cupy.cuda.runtime import getDeviceCount
+        return "cuda" if getDeviceCount() > 0 else "cpu"
+    except Exception:
+        return "cpu"
 
 
 def run_xgboost(
@@ -15,7 +35,9 @@ def run_xgboost(
     Train and predict using an XGBoost regression model.
 
     This function trains an XGBoost regression model using the provided training data
-    and makes predictions on the test data.
+    and makes predictions on the test data. The native XGBoost API is used so that the
+    training data is quantized only once into a QuantileDMatrix, and the test data is
+    predicted in place from the array, without building a DMatrix for it.
 
     Args:
         x_train (array): Numeric array of training features.
@@ -27,33 +49,81 @@ def run_xgboost(
                 - n_estimators (int): The number of boosting rounds (trees).
                 - learning_rate (float): The learning rate (eta).
                 - max_depth (int): The maximum tree depth.
+            Optional:
+                - tree_method (str): The tree construction algorithm. Defaults to "hist",
+                  which is required by QuantileDMatrix.
+                - n_jobs (int): The number of threads used for training. Defaults to N_THREADS
+                  (the CPU count, capped at 8).
+                - device (str): "cpu", "cuda" or "auto" (use CUDA when a GPU is detected).
+                  Defaults to "cpu".
+                - max_bin (int): The maximum number of quantile bins per feature. Defaults to 256.
         random_state (int or None, optional): Seed for random number generation. Defaults to None.
 
     Returns:
         dict: A dictionary containing:
-            - model (XGBRegressor): The trained XGBoost model object.
+            - model (Booster): The trained XGBoost booster.
             - y_pred (array): Array of predicted values on the test set.
     """
-    xgb_model = XGBRegressor(
-        objective=cfg["objective"],  # For regression
-        n_estimators=cfg["n_estimators"],  # Number of trees
-        learning_rate=cfg["learning_rate"],  # Step size
-        max_depth=cfg["max_depth"],  # Maximum tree depth
-        random_state=random_state,  # For reproducibility
-    )
+    params = {
+        "objective": cfg["objective"],  # For regression
+        "learning_rate": cfg["learning_rate"],  # Step size
+        "max_depth": cfg["max_depth"],  # Maximum tree depth
+        "tree_method": cfg.get("tree_method", "hist"),  # Tree construction algorithm
+    }
+    device = cfg.get("device", "cpu")
+    if device == "auto":
+        device = detect_device()
+    params["device"] = device  # XGBoost copies the host arrays to the GPU itself
+    params["max_bin"] = cfg.get("max_bin", 256)  # Must match the QuantileDMatrix bins
+    params["nthread"] = cfg.get("n_jobs", N_THREADS)  # Number of threads
+    if random_state is not None:
+        params["seed"] = random_state  # For reproducibility
+
+    from xgboost import QuantileDMatrix
+    from xgboost import train as xgb_train
+
+    # Quantize the training data once
+    dtrain = QuantileDMatrix(
+        x_train, label=y_train, max_bin=params["max_bin"], nthread=params["nthread"])
 
     # Train the model
-    xgb_model.fit(x_train, y_train)
+    xgb_model = xgb_train(params, dtrain, num_boost_round=cfg["n_estimators"])  # Number of trees
 
-    # Make predictions
-    y_pred = xgb_model.predict(x_test)
+    # Make predictions straight from the array, without building a DMatrix for the test data
+    y_pred = xgb_model.inplace_predict(x_test)
 
     return {"model": xgb_model, "y_pred": y_pred}
 
 
+class LinearModel:
+    """
+    Ordinary least squares model fitted by `run_linear_regression`.
+
+    It exposes the same `coef_`, `intercept_` and `predict` as sklearn's LinearRegression,
+    so it can be used in its place downstream.
+
+    Attributes:
+        coef_ : numpy.ndarray
+            Coefficient for each feature.
+        intercept_ : float
+            Intercept of the model.
+    """
+    __slots__ = ("coef_", "intercept_")
+
+    def __init__(self, coef: array, intercept: float):
+        self.coef_ = coef
+        self.intercept_ = intercept
+
+    def predict(self, x: array) -> array:
+        return x @ self.coef_ + self.intercept_
+
+
 def run_linear_regression(x_train: array, y_train: array, x_test: array):
     """
-    Run linear regression using sklearn
+    Run linear regression, solved in closed form with numpy.linalg.lstsq
+
+    With only a few features, solving the least squares problem directly avoids
+    the input validation and object overhead of sklearn's LinearRegression.
 
     Parameters:
         x_train : array-like of shape (n_samples, n_features)
@@ -62,18 +132,23 @@ def run_linear_regression(x_train: array, y_train: array, x_test: array):
             Training data target
         x_test : array-like of shape (n_samples, n_features)
             Test data features
-        cfg : dict
-            Configuration dictionary containing 'control_method' and 'cv_folds'
 
     Returns:
-        dict : Contains the trained model and predictions
+        dict : Contains the trained model (LinearModel) and predictions
     """
+    x_train = numpy_asarray(x_train)
+    n_samples, n_features = x_train.shape
 
-    # Create and train the linear regression model
-    lm_model = LinearRegression()
+    # Design matrix: a column of ones (for the intercept) followed by the features,
+    # solved in float64 for accuracy. It is stored column-major (Fortran order), the
+    # layout LAPACK's least squares solver works in
+    design = numpy_empty((n_samples, n_features + 1), dtype=numpy_float64, order="F")
+    design[:, 0] = 1.0
+    design[:, 1:] = x_train
 
     # Fit the model
-    lm_model.fit(x_train, y_train)
+    solution = lstsq(design, y_train, rcond=None)[0]
+    lm_model = LinearModel(solution[1:], solution[0])
 
     # Make predictions
     y_pred = lm_model.predict(x_test)
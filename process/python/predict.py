@@ -1,7 +1,51 @@
-from pickle import load as pickle_load
-from xgboost.sklearn import XGBRegressor
-from process.python.data import prep_data_for_predicting
+from typing import TYPE_CHECKING
+from numpy import array as numpy_array
+from numpy.typing import ArrayLike
+from process.python.data import prep_data_for_predicting, ScalerFn
 
-def predict_bc_model(fcst: list, covariants: dict, model: XGBRegressor, scaler: dict):
-    data = prep_data_for_predicting(fcst, covariants, scaler)
+if TYPE_CHECKING:
+    from xgboost import Booster
+    from process.python.method import LinearModel
 
+
+def predict_bc_model(
+    fcst: ArrayLike,
+    covariants: dict,
+    model: "Booster or LinearModel",
+    scaler: dict or ScalerFn) -> numpy_array:
+    """
+    Apply a trained bias correction model to a batch of forecasts.
+
+    The whole batch is combined, scaled and predicted in one go, so the per-call
+    overhead (name checks, buffer setup, model dispatch) is paid once per batch
+    rather than once per sample. When predicting in a serving loop, accumulate
+    samples into batches (of 1024 or more) rather than calling this per sample.
+
+    Parameters:
+        fcst : array-like of shape (B,)
+            Forecast values to be corrected (NumPy arrays are the fast path)
+        covariants : dict
+            Covariant values keyed by name, each of shape (B,), with the same names
+            as used in training (in any order)
+        model : Booster or LinearModel
+            The trained model, e.g. the "model" returned by train_bc_model
+        scaler : dict or ScalerFn
+            The saved scaler returned by train_bc_model, or one already bound to the
+            training names by `bind_scaler`. The covariant names are checked against
+            the scaler's names either way
+
+    Returns: numpy.ndarray of shape (B,)
+        The bias corrected forecasts
+
+    Examples:
+        >>> output = load_output(output_dir="test")
+        >>> scaler_fn = bind_scaler(output["scaler"], output["scaler"]["names"])
+        >>> y_pred = predict_bc_model(fcst, covariants, output["model"], scaler_fn)
+    """
+    x_values = prep_data_for_predicting(fcst, covariants, scaler)
+
+    # An XGBoost booster predicts straight from the array, without building a DMatrix
+    if hasattr(model, "inplace_predict"):
+        return model.inplace_predict(x_values)
+
+    return model.predict(x_values)
@@ -1,18 +1,24 @@
-import xgboost as xgb
-from numpy import array as numpy_array
-from sklearn.metrics import mean_squared_error
+from numpy.typing import ArrayLike
+from process.python import N_THREADS
 from process.python.data import prep_data_for_training
 from process.python.method import run_xgboost
 from process.python.method import run_linear_regression
 from process.python.eval import run_eval, run_feature_importance, run_plot
-from process.python.vis import plot_data
+
+# Bias correction methods, keyed by the `method` argument of train_bc_model
+_METHODS = {
+    "xgboost": lambda x_train, y_train, x_test, cfg, random_state: run_xgboost(
+        x_train, y_train, x_test, cfg["xgboost"], random_state=random_state),
+    "linear_regression": lambda x_train, y_train, x_test, cfg, random_state: run_linear_regression(
+        x_train, y_train, x_test),
+}
 
 
 def train_bc_model(
-    obs: list,
-    fcst: list,
+    obs: ArrayLike,
+    fcst: ArrayLike,
     covariants: dict,
-    test_size: float = 0.2,
+    test_size: float or int = 0.2,
     method: str = "xgboost",
     cfg={
         "xgboost": {
@@ -20,21 +26,30 @@ def train_bc_model(
             "n_estimators": 100,
             "learning_rate": 0.1,
             "max_depth": 3,
+            "tree_method": "hist",
+            "n_jobs": N_THREADS,
+            "device": "auto",
+            "max_bin": 256,
         }
-    }
+    },
+    random_state: int or None = None,
+    verbose: bool = False,
 ):
     """
     Perform bias correction using specified machine learning method.
 
     Parameters
-        obs : list
-            List of observed values
-        fcst : list
-            List of forecast values to be corrected
-        test_size : float, optional (default=0.2)
-            Proportion of the dataset to include in the test split (0 to 1)
-        random_state : int or None, optional (default=None)
-            Random seed for reproducibility of the train-test split
+        obs : array-like
+            Observed values
+        fcst : array-like
+            Forecast values to be corrected
+        covariants : dict
+            Covariant values keyed by name
+            (NumPy arrays are the fast path for obs, fcst and covariants: they are
+            used without converting each element from a Python object)
+        test_size : float or int, optional (default=0.2)
+            Proportion of the dataset to include in the test split (0 to 1),
+            or, as an int, the number of test samples
         method : str, optional (default="xgboost")
             Machine learning method to use for bias correction
             Options: "xgboost", "linear_regression"
@@ -45,6 +60,15 @@ def train_bc_model(
                 - n_estimators: 100
                 - learning_rate: 0.1
                 - max_depth: 3
+                - tree_method: "hist"
+                - n_jobs: number of CPUs, capped at 8
+                - device: "auto" (CUDA if a GPU is detected, otherwise CPU)
+                - max_bin: 256
+        random_state : int or None, optional (default=None)
+            Random seed for reproducibility of the train-test split (and of XGBoost)
+        verbose : bool, optional (default=False)
+            Print the metrics and the feature importance. Formatting the DataFrames
+            for printing is skipped otherwise.
 
     Returns: dict
         Results containing the trained model and predictions
@@ -59,31 +83,32 @@ def train_bc_model(
     Examples
         >>> obs = [1, 2, 3, 4, 5]
         >>> fcst = [1.1, 2.2, 3.1, 4.2, 5.1]
-        >>> results = start_bc(obs, fcst, method="xgboost", show_metrics=True)
+        >>> results = start_bc(obs, fcst, method="xgboost", verbose=True)
     """
 
-    training_data = prep_data_for_training(fcst, covariants, obs, test_size=test_size)
+    if method not in _METHODS:
+        raise Exception(f"Method {method} is not supported")
+
+    training_data = prep_data_for_training(
+        fcst, covariants, obs, test_size=test_size, random_state=random_state)
+
+    x_train, y_train = training_data["x_train"], training_data["y_train"]
 
-    if method == "xgboost":
-        results = run_xgboost(
-            training_data["x_train"], training_data["y_train"], training_data["x_test"], cfg["xgboost"]
-        )
-    if method == "linear_regression":
-        results = run_linear_regression(
-            training_data["x_train"], training_data["y_train"], training_data["x_test"]
-        )
+    results = _METHODS[method](x_train, y_train, training_data["x_test"], cfg, random_state)
 
     metrics = run_eval(results["y_pred"], training_data["y_test"])
     run_plot(fcst, obs, training_data, results)
     feature_importance = run_feature_importance(
-        training_data["x_train"], training_data["y_train"], training_data["x_names"])
+        x_train, y_train, training_data["x_names"],
+        random_state=random_state)
 
-    print("<><><><><><><><><><><><>")
-    print("Training evaluation (Metrics):")
-    print(metrics)
-    print("Training evaluation (Feature importance):")
-    print(feature_importance)
-    print("<><><><><><><><><><><><>")
+    if verbose:
+        print("<><><><><><><><><><><><>")
+        print("Training evaluation (Metrics):")
+        print(metrics)
+        print("Training evaluation (Feature importance):")
+        print(feature_importance)
+        print("<><><><><><><><><><><><>")
 
     return {
         "model": results["model"], 
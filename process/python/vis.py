@@ -1,11 +1,12 @@
-from matplotlib.pyplot import plot, savefig, close, title, legend, scatter, xlabel, xlim, ylim, ylabel
 from process.python import TMP_DIR
 from os.path import join, exists
 from os import makedirs
-from numpy import concatenate as numpy_concatenate
 from numpy import min as numpy_min
 from numpy import max as numpy_max
 
+# Scatter plots with more points than this are drawn with small markers
+LARGE_SAMPLE_SIZE = 1000
+
 
 def plot_data(
         data_dict: dict, 
@@ -14,7 +15,8 @@ def plot_data(
         x_name: str = "obs", 
         y_names: list = ["fcst"],
         title_str: str = "Data comparison",
-        filename: str = "data_comparison.png"):
+        filename: str = "data_comparison.png",
+        ax=None):
     """Plots data from a dictionary as either a scatter or line plot and saves it to a file.
 
     Args:
@@ -25,38 +27,71 @@ def plot_data(
         y_names (list, optional): List of keys in data_dict for y-axis data. Defaults to ["fcst"].
         title (str, optional): Title of the plot. Defaults to "Data comparison".
         filename (str, optional): Name of the output file. Defaults to "data_comparison.png".
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. If given, nothing is saved and
+            the caller owns the figure. Defaults to None.
 
     Behavior:
-        - If use_scatter is True, plots each y_name against x_name as a scatter plot.
+        - If use_scatter is True, plots each y_name against x_name as a rasterized scatter plot.
         - If use_scatter is False, plots x_name and all y_names as lines against an implicit index.
-        - Adds a legend and saves the plot to output_dir/filename.
+        - Adds a legend and, if no ax is given, saves the plot to output_dir/filename.
     """
+    save_fig = ax is None
+    if save_fig:
+        # matplotlib is only imported when a plot is actually made
+        from matplotlib.pyplot import subplots
+        fig, ax = subplots()
 
     if use_scatter:
-        # Calculate global min and max across x and all y values
+        # Calculate global min and max across x and all y values, reducing each
+        # series separately rather than concatenating them into a temporary array
         x_vals = data_dict[x_name]
-        all_vals = numpy_concatenate([x_vals] + [data_dict[y] for y in y_names])
-        min_val, max_val = numpy_min(all_vals), numpy_max(all_vals)
+        min_val = min(numpy_min(data_dict[name]) for name in [x_name] + y_names)
+        max_val = max(numpy_max(data_dict[name]) for name in [x_name] + y_names)
         
+        # Draw the points as one raster layer (the diagonal stays vector), and use
+        # small markers for large samples so drawing doesn't scale with marker area
+        marker_size = 4 if len(x_vals) > LARGE_SAMPLE_SIZE else None
         for i, proc_y_name in enumerate(y_names):
-            scatter(x=data_dict[x_name], y=data_dict[proc_y_name], label=proc_y_name, alpha=0.5)
+            ax.scatter(
+                x=data_dict[x_name],
+                y=data_dict[proc_y_name],
+                label=proc_y_name,
+                alpha=0.5,
+                s=marker_size,
+                linewidths=0,
+                rasterized=True,
+            )
         
-        plot([min_val, max_val], [min_val, max_val], 'k--', alpha=1.0)
-        xlim(min_val, max_val)
-        ylim(min_val, max_val)
-        xlabel(x_name)
-        ylabel("Value")
+        ax.plot([min_val, max_val], [min_val, max_val], 'k--', alpha=1.0)
+        ax.set_xlim(min_val, max_val)
+        ax.set_ylim(min_val, max_val)
+        ax.set_xlabel(x_name)
+        ax.set_ylabel("Value")
     else:
         for data_type in [x_name] + y_names:
-            plot(data_dict[data_type], label=data_type, alpha=0.5)
-    legend()
+            ax.plot(data_dict[data_type], label=data_type, alpha=0.5)
+    ax.legend()
+
+    ax.set_title(title_str)
+
+    if save_fig:
+        save_figure(fig, output_dir, filename)
+
 
-    title(title_str)
+def save_figure(fig, output_dir: str, filename: str):
+    """Saves a figure to output_dir/filename and closes it.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to save.
+        output_dir (str): Directory to save the figure, created if missing.
+        filename (str): Name of the output file.
+    """
+    from matplotlib.pyplot import close
 
     if not exists(output_dir) and len(output_dir) > 0:
         makedirs(output_dir)
 
     output_path = join(output_dir, filename)
     print(f"The makeup data figure is saved in {output_path}")
-    savefig(output_path, bbox_inches="tight")
-    close()
+    fig.savefig(output_path, bbox_inches="tight")
+    close(fig)
@@ -7,7 +7,7 @@ setup(
     author="Sijin Zhang",
     author_email="zsjzyhzp@gmail.com",
     packages=find_packages(),  # Automatically finds your package (e.g., my_package)
-    install_requires=["xgboost", "matplotlib", "pandas"],
+    install_requires=["xgboost>=2.0", "matplotlib", "pandas", "scikit-learn", "joblib"],
     classifiers=[  # Metadata for PyPI
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",